@@ -1,5 +1,6 @@
-import shutil
+import os
 from pathlib import Path
+from typing import Container, Union
 
 TOC_TEMPLATE = """
 Module Reference
@@ -33,6 +34,12 @@ but they should take the stability of that module with a grain of salt...
    plugins/*
 """
 
+_PUBLIC_MODULES = tuple(
+    line
+    for line in (x.strip() for x in TOC_TEMPLATE.splitlines())
+    if line.startswith("ini2toml.")
+)
+
 MODULE_TEMPLATE = """
 ``{name}``
 ~~{underline}~~
@@ -45,37 +52,44 @@ MODULE_TEMPLATE = """
 
 
 def gen_stubs(module_dir: str, output_dir: str):
-    try_rmtree(output_dir)  # Always start fresh
     Path(output_dir, "plugins").mkdir(parents=True, exist_ok=True)
+    files = {Path(output_dir, "modules.rst"): TOC_TEMPLATE}
     for module in iter_public():
-        text = module_template(module)
-        Path(output_dir, f"{module}.rst").write_text(text, encoding="utf-8")
+        files[Path(output_dir, f"{module}.rst")] = module_template(module)
     for module in iter_plugins(module_dir):
         text = module_template(module, "activate")
-        Path(output_dir, f"plugins/{module}.rst").write_text(text, encoding="utf-8")
-    Path(output_dir, "modules.rst").write_text(TOC_TEMPLATE, encoding="utf-8")
+        files[Path(output_dir, f"plugins/{module}.rst")] = text
+    for path, text in files.items():
+        write_if_changed(path, text)
+    # Instead of always starting fresh, remove only the files that are outdated,
+    # so unchanged stubs keep their mtime (and Sphinx does not re-read them)
+    for directory in (output_dir, Path(output_dir, "plugins")):
+        remove_stale(directory, files)
 
 
 def iter_public():
-    lines = (x.strip() for x in TOC_TEMPLATE.splitlines())
-    return (x for x in lines if x.startswith("ini2toml."))
+    return _PUBLIC_MODULES
 
 
 def iter_plugins(module_dir: str):
-    return (
-        f'ini2toml.plugins.{path.with_suffix("").name}'
-        for path in Path(module_dir, "plugins").iterdir()
-        if path.is_file()
-        and path.name not in {".", "..", "__init__.py"}
-        and not path.name.startswith("_")
-    )
-
-
-def try_rmtree(target_dir: str):
-    try:
-        shutil.rmtree(target_dir)
-    except FileNotFoundError:
-        pass
+    with os.scandir(Path(module_dir, "plugins")) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_file() and name.endswith(".py") and not name.startswith("_"):
+                yield f"ini2toml.plugins.{name[:-3]}"
+
+
+def write_if_changed(path: Path, text: str):
+    contents = text.encode("utf-8")
+    if not path.exists() or path.read_bytes() != contents:
+        path.write_bytes(contents)
+
+
+def remove_stale(directory: Union[str, Path], keep: Container[Path]):
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and Path(entry.path) not in keep:
+                os.unlink(entry.path)
 
 
 def module_template(name: str, *members: str) -> str:
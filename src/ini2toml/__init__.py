@@ -1,10 +1,17 @@
-from importlib.metadata import PackageNotFoundError, version
+# Change here if project is renamed and does not equal the package name
+dist_name = __name__
 
-try:
-    # Change here if project is renamed and does not equal the package name
-    dist_name = __name__
-    __version__ = version(dist_name)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
-finally:
-    del version, PackageNotFoundError
+
+def __getattr__(name: str):
+    # Looking up the version requires scanning the installed distributions,
+    # so it is postponed until someone actually needs it (PEP 562).
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version(dist_name)
+        except PackageNotFoundError:  # pragma: no cover
+            value = "unknown"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
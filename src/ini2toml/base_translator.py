@@ -1,5 +1,4 @@
 import inspect
-from functools import reduce
 from types import MappingProxyType
 from typing import Dict, Generic, List, Mapping, Sequence, TypeVar, cast
 
@@ -10,7 +9,6 @@ from .errors import (
     UndefinedProfile,
 )
 from .profile import Profile, ProfileAugmentation
-from .transformations import apply
 
 T = TypeVar("T")
 EMPTY = MappingProxyType({})  # type: ignore
@@ -150,11 +148,16 @@ class BaseTranslator(Generic[T]):
         # ^--- avoid permanent changes and conflicts with duplicated augmentation
         self._add_augmentations(profile, active_augmentations)
 
-        ini = reduce(apply, profile.pre_processors, ini)
+        # Plain loops avoid an extra function call (``apply``) per processor
+        for pre_process in profile.pre_processors:
+            ini = pre_process(ini)
         irepr = self.loads(ini)
-        irepr = reduce(apply, profile.intermediate_processors, irepr)
-        toml = self.dumps(irepr)
-        return reduce(apply, profile.post_processors, toml)
+        for process in profile.intermediate_processors:
+            irepr = process(irepr)
+        text = cast(str, self.dumps(irepr))  # post-processors work on text
+        for post_process in profile.post_processors:
+            text = post_process(text)
+        return cast(T, text)
 
 
 def _deduplicate_plugins(plugins: Sequence[types.Plugin]) -> List[types.Plugin]:
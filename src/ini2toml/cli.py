@@ -1,21 +1,24 @@
 import argparse
 import logging
+import re
 import sys
 from contextlib import contextmanager
+from functools import lru_cache
 from itertools import chain
 from os import pathsep
 from pathlib import Path
-from textwrap import dedent, wrap
-from typing import Dict, List, Optional, Sequence
+from textwrap import wrap
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from . import __version__
-from .translator import Translator
 from .types import CLIChoice, Profile, ProfileAugmentation
 
 _logger = logging.getLogger(__package__)
 
 DEFAULT_PROFILE = "best_effort"
 
+_WHITESPACE = re.compile(r"\s+")
+
 
 @contextmanager
 def critical_logging():
@@ -36,13 +39,11 @@ META: Dict[str, dict] = {
     ),
     "input_file": dict(
         dest="input_file",
-        type=argparse.FileType("r"),
-        help=".cfg/.ini file to be converted",
+        help=".cfg/.ini file to be converted (`-` for `stdin`)",
     ),
     "output_file": dict(
         flags=("-o", "--output-file"),
         default="-",
-        type=argparse.FileType("w"),
         help="file where to write the converted TOML (`stdout` by default)",
     ),
     "profile": dict(
@@ -85,7 +86,7 @@ META: Dict[str, dict] = {
 
 
 def __meta__(
-    profiles: Sequence[Profile], augmentations: Sequence[ProfileAugmentation]
+    profiles: Collection[Profile], augmentations: Collection[ProfileAugmentation]
 ) -> Dict[str, dict]:
     """'Hyper parameters' to instruct :mod:`argparse` how to create the CLI"""
     meta = {k: v.copy() for k, v in META.items()}
@@ -108,24 +109,27 @@ def __meta__(
 
 def parse_args(
     args: Sequence[str],
-    profiles: Sequence[Profile],
-    augmentations: Sequence[ProfileAugmentation],
+    profiles: Collection[Profile],
+    augmentations: Collection[ProfileAugmentation],
 ) -> argparse.Namespace:
     """Parse command line parameters
 
     Args:
       args: command line parameters as list of strings (for example  ``["--help"]``).
 
-    Returns: command line parameters namespace
+    Returns: command line parameters namespace.
+      ``input_file`` and ``output_file`` are paths (``-`` for ``stdin``/``stdout``),
+      and the contents of the input file are given by ``input_text``.
     """
-    description = "Automatically converts .cfg/.ini files into TOML"
-    parser = argparse.ArgumentParser(description=description, formatter_class=Formatter)
-    for opts in __meta__(profiles, augmentations).values():
-        parser.add_argument(*opts.pop("flags", ()), **opts)
-    parser.set_defaults(loglevel=logging.WARNING)
+    parser = build_parser(profiles, augmentations)
     params = parser.parse_args(args)
+    try:
+        # Read the input before any output is written (errors are usage errors)
+        params.input_text = _read_input(params.input_file)
+    except OSError as ex:
+        parser.error(f"argument input_file: can't open {params.input_file!r}: {ex}")
     profile_names = [p.name for p in profiles]
-    profile = guess_profile(params.profile, params.input_file.name, profile_names)
+    profile = guess_profile(params.profile, params.input_file, profile_names)
     params.profile = profile
     opts = vars(params)
     active_augmentations = {k: True for k in (opts.get("enable") or ())}
@@ -134,6 +138,53 @@ def parse_args(
     return params
 
 
+def build_parser(
+    profiles: Collection[Profile], augmentations: Collection[ProfileAugmentation]
+) -> argparse.ArgumentParser:
+    """Create the :mod:`argparse` parser for the CLI.
+
+    Parsers are cached and reused when the same profiles/augmentations are given
+    (e.g. when :func:`run` is called several times in the same process).
+    """
+    return _cached_parser(_ParserSpec(profiles, augmentations))
+
+
+class _ParserSpec:
+    """Hashable view of the profiles/augmentations used to build a parser.
+    Specs with the same names/help texts are equal, so they share a cached parser.
+    """
+
+    __slots__ = ("profiles", "augmentations", "key")
+
+    def __init__(
+        self,
+        profiles: Collection[Profile],
+        augmentations: Collection[ProfileAugmentation],
+    ):
+        self.profiles = profiles
+        self.augmentations = augmentations
+        self.key = (
+            tuple((p.name, p.help_text) for p in profiles),
+            tuple((a.name, a.active_by_default, a.help_text) for a in augmentations),
+        )
+
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+
+@lru_cache(maxsize=8)
+def _cached_parser(spec: _ParserSpec) -> argparse.ArgumentParser:
+    description = "Automatically converts .cfg/.ini files into TOML"
+    parser = argparse.ArgumentParser(description=description, formatter_class=Formatter)
+    for opts in __meta__(spec.profiles, spec.augmentations).values():
+        parser.add_argument(*opts.pop("flags", ()), **opts)
+    parser.set_defaults(loglevel=logging.WARNING)
+    return parser
+
+
 def setup_logging(loglevel: int):
     """Setup basic logging
 
@@ -166,16 +217,31 @@ def run(args: Sequence[str] = ()):
           (for example  ``["--verbose", "setup.cfg"]``).
     """
     with critical_logging():
+        from .translator import Translator  # Loading plugins is not always needed
+
         args = args or sys.argv[1:]
         translator = Translator()
-        profiles = list(translator.profiles.values())
-        profile_augmentations = list(translator.augmentations.values())
+        profiles = translator.profiles.values()
+        profile_augmentations = translator.augmentations.values()
         params = parse_args(args, profiles, profile_augmentations)
     setup_logging(params.loglevel)
-    out = translator.translate(
-        params.input_file.read(), params.profile, params.active_augmentations
-    )
-    params.output_file.write(out)
+    text = params.input_text
+    out = translator.translate(text, params.profile, params.active_augmentations)
+    # Only open (and truncate) the output file once the translation succeeded
+    _write_output(params.output_file, out)
+
+
+def _read_input(file: str) -> str:
+    if file == "-":
+        return sys.stdin.read()
+    return Path(file).read_text(encoding="utf-8")
+
+
+def _write_output(file: str, text: str):
+    if file == "-":
+        sys.stdout.write(text)
+    else:
+        Path(file).write_text(text, encoding="utf-8")
 
 
 class Formatter(argparse.RawTextHelpFormatter):
@@ -184,7 +250,12 @@ class Formatter(argparse.RawTextHelpFormatter):
     # "private" method considered to be an implementation detail.
 
     def _split_lines(self, text, width):
-        return list(chain.from_iterable(wrap(x, width) for x in text.splitlines()))
+        return list(_wrap_lines(text, width))
+
+
+@lru_cache(maxsize=512)
+def _wrap_lines(text: str, width: int) -> Tuple[str, ...]:
+    return tuple(chain.from_iterable(wrap(x, width) for x in text.splitlines()))
 
 
 def guess_profile(profile: Optional[str], file_name: str, available: List[str]) -> str:
@@ -207,19 +278,19 @@ def guess_profile(profile: Optional[str], file_name: str, available: List[str])
     return DEFAULT_PROFILE
 
 
-def _choices_help(choices: Sequence[CLIChoice], filt=lambda _: True) -> str:
+def _choices_help(choices: Iterable[CLIChoice], filt=lambda _: True) -> str:
     """``filt``: predicate function, only choices for which ``filt(c)`` is ``True`` will
     be included in the help text.
     """
     return "\n".join(_format_choice_help(c) for c in choices if filt(c))
 
 
+@lru_cache(maxsize=256)
 def _flatten_str(text: str) -> str:
     if not text:
         return text
-    text = " ".join(x.strip() for x in dedent(text).splitlines()).strip()
-    text = text.rstrip(".,;").strip()
-    return (text[0].lower() + text[1:]).strip()
+    text = _WHITESPACE.sub(" ", text).strip().rstrip(".,;").strip()
+    return text[:1].lower() + text[1:]
 
 
 def _format_choice_help(choice: CLIChoice) -> str:
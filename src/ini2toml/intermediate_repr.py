@@ -80,9 +80,7 @@ class IntermediateRepr(MutableMapping):
         self.inline_comment = inline_comment
         self.elements.update(el)
         self.order.extend(order or self.elements.keys())
-        elem_not_in_order = any(k not in self.order for k in self.elements)
-        order_not_in_elem = any(k not in self.elements for k in self.order)
-        if elem_not_in_order or order_not_in_elem:
+        if self.elements.keys() != set(self.order):
             raise ValueError(f"{order} and {elements} need to have the same keys")
 
     def __repr__(self):
@@ -112,9 +110,9 @@ class IntermediateRepr(MutableMapping):
         """
         if old_key == new_key:
             return self
-        if new_key in self.order:
+        if new_key in self.elements:
             raise KeyError(f"new_key={new_key!r} already exists")
-        if old_key not in self.order and ignore_missing:
+        if old_key not in self.elements and ignore_missing:
             return self
         i = self.order.index(old_key)
         self.order[i] = new_key
@@ -125,7 +123,7 @@ class IntermediateRepr(MutableMapping):
         """Simulate the position-aware :meth:`collections.abc.MutableMapping.insert`
         method, but also require a ``key`` to be specified.
         """
-        if key in self.order:
+        if key in self.elements:
             raise KeyError(f"key={key!r} already exists")
         self.order.insert(position, key)
         self.elements[key] = value
@@ -152,13 +150,19 @@ class IntermediateRepr(MutableMapping):
         All the other keys in ``existing_keys`` are removed and the value of
         ``new_key`` is set to ``value``.
         """
-        idx = [self.index(k) for k in existing_keys if k in self]
-        if not idx:
-            i = len(self)
-        else:
-            i = sorted(idx)[0]
-            for key in existing_keys:
-                self.pop(key, None)
+        # Walk ``order`` only once, instead of calling ``index`` and ``pop``
+        # (each one a linear scan) for every single key
+        existing = {k for k in existing_keys if k in self.elements}
+        i = len(self.order)
+        if existing:
+            order: List[Key] = []
+            for key in self.order:
+                if key in existing:
+                    i = min(i, len(order))
+                    del self.elements[key]
+                else:
+                    order.append(key)
+            self.order[:] = order
         self.insert(i, new_key, value)
         return i
 
@@ -187,6 +191,8 @@ class IntermediateRepr(MutableMapping):
 
 
 class Commented(Generic[T]):
+    __slots__ = ("value", "comment")
+
     def __init__(
         self,
         value: Union[T, NotGiven] = NOT_GIVEN,
@@ -2,17 +2,40 @@
 # published under the MIT license
 # The original PyScaffold license can be found in 'tests/examples/pyscaffold'
 
-from importlib.metadata import EntryPoint, entry_points
+from functools import lru_cache
 from textwrap import dedent
-from typing import Any, Callable, Iterable, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, cast
 
-from .. import __version__
 from ..types import Plugin
 
+if TYPE_CHECKING:
+    # importlib.metadata is expensive to import, so it is only loaded when needed
+    from importlib.metadata import EntryPoint
+
 ENTRYPOINT_GROUP = "ini2toml.processing"
 
 
-def iterate_entry_points(group=ENTRYPOINT_GROUP) -> Iterable[EntryPoint]:
+def __getattr__(name: str):
+    # Keep ``EntryPoint`` importable from this module without paying for the
+    # ``importlib.metadata`` import until it is actually requested
+    if name == "EntryPoint":
+        from importlib.metadata import EntryPoint
+
+        return EntryPoint
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _all_entry_points():
+    """Scanning the metadata of all the installed distributions is expensive,
+    so it is done only once (use ``_all_entry_points.cache_clear()`` to reset).
+    """
+    from importlib.metadata import entry_points
+
+    return entry_points()
+
+
+def iterate_entry_points(group=ENTRYPOINT_GROUP) -> Iterable["EntryPoint"]:
     """Produces a generator yielding an EntryPoint object for each plugin registered
     via `setuptools`_ entry point mechanism.
 
@@ -22,20 +45,28 @@ def iterate_entry_points(group=ENTRYPOINT_GROUP) -> Iterable[EntryPoint]:
 
     .. _setuptools: https://setuptools.pypa.io/en/latest/userguide/entry_point.html
     """  # noqa
-    entries = entry_points()
+    return sorted(_select_entry_points(group), key=_entry_point_name)
+
+
+def _select_entry_points(group: str) -> Iterable["EntryPoint"]:
+    entries = _all_entry_points()
     if hasattr(entries, "select"):
         # The select method was introduced in importlib_metadata 3.9/3.10
         # and the previous dict interface was declared deprecated
         select = cast(Any, getattr(entries, "select"))  # typecheck gymnastic # noqa
-        entries_: Iterable[EntryPoint] = select(group=group)
+        entries_: Iterable["EntryPoint"] = select(group=group)
     else:
         # TODO: Once Python 3.10 becomes the oldest version supported, this fallback
         #       and conditional statement can be removed.
         entries_ = (plugin for plugin in entries.get(group, []))
-    return sorted(entries_, key=lambda e: e.name)
+    return entries_
 
 
-def load_from_entry_point(entry_point: EntryPoint) -> Plugin:
+def _entry_point_name(entry_point: "EntryPoint") -> str:
+    return entry_point.name
+
+
+def load_from_entry_point(entry_point: "EntryPoint") -> Plugin:
     """Carefully load the plugin, raising a meaningful message in case of errors"""
     try:
         return entry_point.load()
@@ -45,7 +76,7 @@ def load_from_entry_point(entry_point: EntryPoint) -> Plugin:
 
 def list_from_entry_points(
     group: str = ENTRYPOINT_GROUP,
-    filtering: Callable[[EntryPoint], bool] = lambda _: True,
+    filtering: Callable[["EntryPoint"], bool] = lambda _: True,
 ) -> List[Plugin]:
     """Produces a list of plugin objects for each plugin registered
     via `setuptools`_ entry point mechanism.
@@ -59,9 +90,10 @@ def list_from_entry_points(
 
     .. _setuptools: https://setuptools.pypa.io/en/latest/userguide/entry_point.html
     """  # noqa
-    return [
-        load_from_entry_point(e) for e in iterate_entry_points(group) if filtering(e)
-    ]
+    # Filter before sorting, so the entry points that are going to be discarded
+    # don't need to be sorted
+    selected = filter(filtering, _select_entry_points(group))
+    return [load_from_entry_point(e) for e in sorted(selected, key=_entry_point_name)]
 
 
 class ErrorLoadingPlugin(RuntimeError):
@@ -70,10 +102,12 @@ class ErrorLoadingPlugin(RuntimeError):
     with {package} {version}. You can also try uninstalling it.
     """
 
-    def __init__(self, plugin: str = "", entry_point: Optional[EntryPoint] = None):
+    def __init__(self, plugin: str = "", entry_point: Optional["EntryPoint"] = None):
         if entry_point and not plugin:
             plugin = getattr(entry_point, "module", entry_point.name)
 
+        from .. import __version__
+
         sub = dict(package=__package__, version=__version__, plugin=plugin)
         msg = dedent(self.__doc__ or "").format(**sub).splitlines()
         super().__init__(f"{msg[0]}\n{' '.join(msg[1:])}")
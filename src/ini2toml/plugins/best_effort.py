@@ -8,6 +8,7 @@ from ..types import HiddenKey, IntermediateRepr, Translator
 M = TypeVar("M", bound=IntermediateRepr)
 
 _SECTION_SPLITTER = re.compile(r"\.|:|\\")
+_SECTION_SEPARATORS = frozenset(".:\\")  # same characters as _SECTION_SPLITTER
 _KEY_SEP = "="
 
 
@@ -21,6 +22,8 @@ def activate(translator: Translator):
 class BestEffort:
     """Guess option value conversion based on the string format"""
 
+    __slots__ = ("key_sep", "section_splitter", "split_dict")
+
     def __init__(
         self,
         key_sep=_KEY_SEP,
@@ -31,20 +34,29 @@ class BestEffort:
         self.split_dict = partial(split_kv_pairs, key_sep=key_sep)
 
     def process_values(self, doc: M) -> M:
-        doc_items = list(doc.items())
-        for name, section in doc_items:
+        # Only the keys need a snapshot, since nested sections are renamed below
+        for name in list(doc):
+            section = doc[name]
             doc[name] = self.apply_best_effort_to_section(section)
             # Separate nested sections
-            if self.section_splitter.search(name):
-                keys = tuple(self.section_splitter.split(name))
-                doc.rename(name, keys)
+            if self._may_be_nested(name):
+                keys = self.section_splitter.split(name)
+                if len(keys) > 1:
+                    doc.rename(name, tuple(keys))
         return doc
 
+    def _may_be_nested(self, name: str) -> bool:
+        if self.section_splitter is _SECTION_SPLITTER:
+            # Most section names are flat, so skip the regex engine when possible
+            return not _SECTION_SEPARATORS.isdisjoint(name)
+        return True  # custom splitters are always given a chance
+
     def apply_best_effort_to_section(self, section: M) -> M:
-        options = list(section.items())
-        # Convert option values:
-        for field, value in options:
-            self.apply_best_effort(section, field, value)
+        # Convert option values (existing keys are only reassigned, never added or
+        # removed, so it is safe to iterate directly):
+        apply = self.apply_best_effort  # bind once, outside of the loop
+        for field, value in section.items():
+            apply(section, field, value)
         return section
 
     def apply_best_effort(self, container: M, field: str, value: str):
@@ -12,49 +12,58 @@ M = TypeVar("M", bound=MutableMapping)
 
 def activate(translator: Translator):
     plugin = Coverage()
+    process = plugin.process_values  # bind once, share between all the profiles
     profile = translator[".coveragerc"]
 
-    fn = partial(plugin.process_values, prefix="")
-    update_wrapper(fn, plugin.process_values)
+    fn = update_wrapper(partial(process, prefix=""), process)
     profile.intermediate_processors.append(fn)
     profile.help_text = plugin.__doc__ or ""
 
     for file in ("setup.cfg", "tox.ini"):
-        translator[file].intermediate_processors.append(plugin.process_values)
+        translator[file].intermediate_processors.append(process)
 
 
 class Coverage:
     """Convert settings to 'pyproject.toml' equivalent"""
 
+    __slots__ = ()
+
     PREFIX = "coverage:"
     SECTIONS = ("run", "paths", "report", "html", "xml", "json")
-    LIST_VALUES = (
-        "exclude_lines",
-        "concurrency",
-        "disable_warnings",
-        "debug",
-        "include",
-        "omit",
-        "plugins",
-        "source",
-        "source_pkgs",
-        "partial_branches",
+    LIST_VALUES = frozenset(
+        (
+            "exclude_lines",
+            "concurrency",
+            "disable_warnings",
+            "debug",
+            "include",
+            "omit",
+            "plugins",
+            "source",
+            "source_pkgs",
+            "partial_branches",
+        )
     )
 
     def process_values(self, doc: M, sections=SECTIONS, prefix=PREFIX) -> M:
-        for name in sections:
-            candidates = [
-                doc.get(f"{prefix}{name}"),
-                doc.get("tool", {}).get("coverage", {}).get(name),
-                doc.get(("tool", "coverage"), {}).get(name),
-                doc.get(("tool", "coverage", name)),
-            ]
-            for section in candidates:
-                if section:
-                    self.process_section(section)
+        # The '.coveragerc' profile uses an empty prefix: no need to build new names
+        keys = [prefix + name for name in sections] if prefix else sections
+        candidates = [doc.get(key) for key in keys]
+        candidates += [doc.get(("tool", "coverage", name)) for name in sections]
+        # The parent tables do not change while the sections are processed,
+        # and they are usually absent, so they are only searched if present
+        tool = doc.get("tool")
+        tool_coverage = tool.get("coverage") if tool else None
+        for parent in (tool_coverage, doc.get(("tool", "coverage"))):
+            if parent:
+                candidates += [parent.get(name) for name in sections]
+        for section in candidates:
+            if section:
+                self.process_section(section)
         return doc
 
     def process_section(self, section: M):
+        list_values = self.LIST_VALUES  # local lookups are cheaper inside the loop
         for field in section:
-            fn: T = split_list if field in self.LIST_VALUES else coerce_scalar
+            fn: T = split_list if field in list_values else coerce_scalar
             section[field] = fn(section[field])
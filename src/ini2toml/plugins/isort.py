@@ -12,19 +12,21 @@ M = TypeVar("M", bound=MutableMapping)
 
 def activate(translator: Translator):
     plugin = ISort()
+    process = plugin.process_values  # bind once, share between all the profiles
     profile = translator[".isort.cfg"]
-    fn = partial(plugin.process_values, section_name="settings")
-    update_wrapper(fn, plugin.process_values)
+    fn = update_wrapper(partial(process, section_name="settings"), process)
     profile.intermediate_processors.append(fn)
     profile.help_text = plugin.__doc__ or ""
 
     for file in ("setup.cfg", "tox.ini"):
-        translator[file].intermediate_processors.append(plugin.process_values)
+        translator[file].intermediate_processors.append(process)
 
 
 class ISort:
     """Convert settings to 'pyproject.toml' equivalent"""
 
+    __slots__ = ()
+
     FIELDS = {
         "force_to_top",
         "treat_comments_as_code",
@@ -40,9 +42,10 @@ class ISort:
         "add_imports",
         "remove_imports",
     }
+    _STATIC_FIELDS = frozenset({*FIELDS, *map(kebab_case, FIELDS)})
 
-    FIELD_ENDS = ["skip", "glob", "paths", "exclusions", "plugins"]
-    FIELD_STARTS = ["known", "extra"]
+    FIELD_ENDS = ("skip", "glob", "paths", "exclusions", "plugins")
+    FIELD_STARTS = ("known", "extra")
 
     # dicts? ["import_headings", "git_ignore", "know_other"]
 
@@ -51,13 +54,10 @@ class ISort:
             field
             for field in section
             if isinstance(field, str)
-            and (
-                any(field.startswith(s) for s in self.FIELD_STARTS)
-                or any(field.endswith(s) for s in self.FIELD_ENDS)
-            )
+            and (field.startswith(self.FIELD_STARTS) or field.endswith(self.FIELD_ENDS))
         )
-        fields = {*self.FIELDS, *dynamic_fields}
-        return {*fields, *map(kebab_case, fields)}
+        dynamic = set(dynamic_fields)
+        return {*self._STATIC_FIELDS, *dynamic, *map(kebab_case, dynamic)}
 
     def process_values(self, doc: M, section_name="isort") -> M:
         candidates = [
@@ -14,6 +14,9 @@ R = TypeVar("R", bound=IntermediateRepr)
 
 list_comma = partial(split_list, sep=",")
 
+_QUOTES_AND_SPACES = '"' + string.whitespace
+_OVERRIDE_PREFIX = "mypy-"
+
 
 def activate(translator: Translator):
     plugin = Mypy()
@@ -26,23 +29,27 @@ def activate(translator: Translator):
 class Mypy:
     """Convert settings to 'pyproject.toml' equivalent"""
 
-    LIST_VALUES = (
-        "files",
-        "always_false",
-        "disable_error_code",
-        "plugins",
+    __slots__ = ()
+
+    LIST_VALUES = frozenset(
+        (
+            "files",
+            "always_false",
+            "disable_error_code",
+            "plugins",
+        )
     )
 
-    DONT_TOUCH = ("python_version",)
+    DONT_TOUCH = frozenset(("python_version",))
 
     def process_values(self, doc: M) -> M:
         for parent in (doc, doc.get("tool", {})):
-            for key in list(parent.keys()):  # need to be eager: we will delete elements
+            for key in tuple(parent):  # need to be eager: we will delete elements
                 key_ = key[-1] if isinstance(key, tuple) else key
                 if not isinstance(key_, str):
                     continue
-                name = key_.strip('"' + string.whitespace)
-                if name.startswith("mypy-"):
+                name = key_.strip(_QUOTES_AND_SPACES)
+                if name.startswith(_OVERRIDE_PREFIX):
                     overrides = self.get_or_create_overrides(parent)
                     self.process_overrides(parent.pop(key), overrides, name)
                 elif name == "mypy":
@@ -51,16 +58,20 @@ class Mypy:
 
     def process_overrides(self, section: R, overrides: MutableSequence, name: str) -> R:
         section = self.process_options(section)
-        modules = [n.replace("mypy-", "") for n in name.split(",")]
+        prefix, size = _OVERRIDE_PREFIX, len(_OVERRIDE_PREFIX)
+        # Module names cannot contain '-', so the prefix can only be at the start
+        modules = [n[size:] if n.startswith(prefix) else n for n in name.split(",")]
         self.add_overrided_modules(section, name, modules)
         overrides.append(section)
         return section
 
     def process_options(self, section: M) -> M:
+        # local lookups are cheaper inside the loop
+        list_values, dont_touch = self.LIST_VALUES, self.DONT_TOUCH
         for field in section:
-            if field in self.DONT_TOUCH:
+            if field in dont_touch:
                 continue
-            fn: T = split_list if field in self.LIST_VALUES else coerce_scalar
+            fn: T = split_list if field in list_values else coerce_scalar
             section[field] = fn(section[field])
         return section
 
@@ -28,21 +28,27 @@ def activate(translator: Translator):
 class Pytest:
     """Convert settings to 'pyproject.toml' ('ini_options' table)"""
 
-    LINE_SEPARATED_LIST_VALUES = (
-        "markers",
-        "filterwarnings",
+    __slots__ = ()
+
+    LINE_SEPARATED_LIST_VALUES = frozenset(
+        (
+            "markers",
+            "filterwarnings",
+        )
     )
-    SPACE_SEPARATED_LIST_VALUES = (
-        "norecursedirs",
-        "python_classes",
-        "python_files",
-        "python_functions",
-        "required_plugins",
-        "testpaths",
-        "usefixtures",
+    SPACE_SEPARATED_LIST_VALUES = frozenset(
+        (
+            "norecursedirs",
+            "python_classes",
+            "python_files",
+            "python_functions",
+            "required_plugins",
+            "testpaths",
+            "usefixtures",
+        )
     )
 
-    DONT_TOUCH = ("minversion",)
+    DONT_TOUCH = frozenset(("minversion",))
 
     def process_values(self, doc: R) -> R:
         candidates = [
@@ -66,10 +72,10 @@ class Pytest:
                 section[field] = _split_lines(section[field])
             elif field in self.SPACE_SEPARATED_LIST_VALUES:
                 section[field] = _split_spaces(section[field])
-            elif hasattr(self, f"_process_{field}"):
-                section[field] = getattr(self, f"_process_{field}")(section[field])
             else:
-                section[field] = coerce_scalar(section[field])
+                # Single attribute lookup (instead of ``hasattr`` + ``getattr``)
+                fn = getattr(self, f"_process_{field}", coerce_scalar)
+                section[field] = fn(section[field])
 
     def _process_addopts(self, content: str) -> Union[Commented[str], str]:
         # pytest-dev/pytest#12228: pytest maintainers recommend addopts as string.
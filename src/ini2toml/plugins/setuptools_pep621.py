@@ -1,17 +1,17 @@
 import logging
 import re
 import warnings
-from functools import partial, reduce
+from functools import lru_cache, partial
 from itertools import chain, zip_longest
+from types import MappingProxyType
 from typing import (
     Any,
     Dict,
-    Iterator,
+    FrozenSet,
     List,
     Mapping,
     Optional,
     Sequence,
-    Set,
     Tuple,
     Type,
     TypeVar,
@@ -23,10 +23,7 @@ try:
 except ImportError:  # pragma: no cover
     from setuptools.extern.packaging.requirements import Requirement  # type: ignore
 
-from distutils import command as distutils_commands
-
 from ..transformations import (
-    apply,
     coerce_bool,
     deprecated,
     kebab_case,
@@ -81,11 +78,38 @@ COMMAND_SECTIONS = (
     "sdist",
     "bdist",
     "bdist_wheel",
-    *getattr(distutils_commands, "__all__", []),
 )
 SKIP_COMMAND_SECTIONS = {
     "isort",
 }
+SETUPCFG_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "classifier": "classifiers",
+        "summary": "description",
+        "platform": "platforms",
+        "license-file": "license-files",
+        "home-page": "url",
+    }
+)
+"""Deprecated ``[metadata]`` aliases (read-only mapping: alias => canonic name)"""
+# Top-level keys kept by ensure_pep518 (``metadata``, ``options`` and the sections
+# with the prefixes below are renamed later on)
+PEP518_ALLOWED = frozenset(("build-system", "project", "tool", "metadata", "options"))
+PEP518_ALLOWED_PREFIXES = ("options.", "project:")
+# Constant (old, new) name pairs used by the renaming transformations
+URL_RENAMES = (("url", "Homepage"), ("download-url", "Download"))
+OPTIONS_IN_PEP621 = (
+    ("python-requires", "requires-python"),
+    ("install-requires", "dependencies"),
+    ("entry-points", "entry-points"),
+)
+METADATA_NOT_IN_PEP621 = ("platforms", "provides", "obsoletes", "license-files")
+SCRIPT_ENTRYPOINTS = (
+    "console-scripts",
+    "gui-scripts",
+    "console_scripts",
+    "gui_scripts",
+)
 
 
 def activate(translator: Translator):
@@ -98,6 +122,8 @@ def activate(translator: Translator):
 class SetuptoolsPEP621:
     """Convert settings to 'pyproject.toml' based on :pep:`621`"""
 
+    __slots__ = ("_be",)
+
     BUILD_REQUIRES = ("setuptools>=61.2",)
 
     def __init__(self):
@@ -125,87 +151,23 @@ class SetuptoolsPEP621:
         """``setup.cfg`` aliases as defined in:
         https://setuptools.pypa.io/en/stable/userguide/declarative_config.html
         """
-        return {
-            "classifier": "classifiers",
-            "summary": "description",
-            "platform": "platforms",
-            "license-file": "license-files",
-            "home-page": "url",
-        }
+        return dict(SETUPCFG_ALIASES)  # copy: callers/subclasses may modify it
 
     def processing_rules(self) -> ProcessingRules:
         """Value type processing, as defined in:
         https://setuptools.pypa.io/en/stable/userguide/declarative_config.html
         """
         # If not present below will be transformed via split_comment by default
-        return {
-            ("metadata", "version"): directive("file", "attr"),
-            ("metadata", "classifiers"): directive("file", orelse=split_list_comma),
-            ("metadata", "keywords"): split_keywords,
-            ("metadata", "description"): directive("file"),
-            # ---
-            ("metadata", "long-description"): directive("file", orelse=noop),
-            ("metadata", "long-description-content-type"): split_hash_comment,
-            # => NOTICE: further processed via
-            #            `merge_and_rename_long_description_and_content_type`
-            # ---
-            ("metadata", "license-files"): split_list_comma,
-            # => NOTICE: not standard for now, needs PEP 639
-            #            further processed via `remove_metadata_not_in_pep621`
-            # ---
-            ("metadata", "url"): split_url,
-            ("metadata", "download-url"): split_url,
-            ("metadata", "project-urls"): split_kv_urls,
-            # => NOTICE: further processed via `merge_and_rename_urls`
-            # ---- Not covered by PEP 621 ----
-            ("metadata", "platforms"): split_list_comma,
-            # ---
-            ("metadata", "provides"): split_list_comma,
-            ("metadata", "requires"): deprecated("requires", split_list_comma),
-            ("metadata", "obsoletes"): split_list_comma,
-            # => NOTICE: not supported by pip
-            # ---- Options ----
-            ("options", "zip-safe"): split_bool,
-            ("options", "setup-requires"): split_deps,
-            ("options", "install-requires"): directive("file", orelse=split_deps),
-            ("options", "tests-require"): split_deps,
-            ("options", "scripts"): split_list_comma,
-            ("options", "eager-resources"): split_list_comma,
-            ("options", "dependency-links"): deprecated(
-                "dependency-links", split_list_comma
-            ),  # noqa
-            ("options", "entry-points"): directive(
-                "file", orelse=value_error("option.entry-points")
-            ),
-            ("options", "include-package-data"): split_bool,
-            ("options", "package-dir"): split_kv_pairs,
-            ("options", "namespace-packages"): split_list_comma,
-            ("options", "py-modules"): split_list_comma,
-            ("options", "cmdclass"): split_kv_pairs,
-            ("options", "data-files"): deprecated("data-files", split_kv_of_lists),
-            ("options", "packages"): directive(
-                "find", "find_namespace", orelse=split_list_comma
-            ),
-            ("options.packages.find", "include"): split_list_comma,
-            ("options.packages.find", "exclude"): split_list_comma,
-            ("options.packages.find", "exclude"): split_list_comma,
-        }
         # See also dependent_processing_rules
+        return dict(_processing_rules())  # copy: callers/subclasses may modify it
 
     def dependent_processing_rules(self, doc: IR) -> ProcessingRules:
         """Dynamically create processing rules, such as :func:`processing_rules` based
         on the existing document.
         """
-        groups: Mapping[str, Transformation] = {
-            "options.extras-require": directive("file", orelse=split_deps),
-            "options.package-data": split_list_comma,
-            "options.exclude-package-data": split_list_comma,
-            "options.data-files": split_list_comma,
-            "options.entry-points": split_kv_pairs,
-        }
         return {
             (g, k): fn
-            for g, fn in groups.items()
+            for g, fn in _dependent_processing_groups().items()
             for k in doc.get(g, ())
             if isinstance(k, str)
         }
@@ -216,22 +178,27 @@ class SetuptoolsPEP621:
 
         This function assumes all field names were normalised by :meth:`normalise_keys`.
         """
-        default = {
-            (name, option): split_comment
-            for name, section in doc.items()
-            if name in ("metadata", "options")
-            for option in section
-            if isinstance(option, (str, tuple)) and not isinstance(option, HiddenKey)
-        }
-        transformations: dict = {
-            **default,
-            **self.processing_rules(),
-            **self.dependent_processing_rules(doc),
-        }
-        for (section, option), fn in transformations.items():
-            value = doc.get(section, {}).get(option, None)
+        rules = self.processing_rules()
+        dependent_rules = self.dependent_processing_rules(doc)
+        # Options without a specific rule are simply split from their comments
+        # (there is no need to build an intermediate dict with default rules)
+        for name in SETUPTOOLS_SECTIONS:
+            table = doc.get(name) or {}
+            for key in table:
+                if not isinstance(key, (str, tuple)) or (name, key) in rules:
+                    continue
+                value = table[key]
+                if value is not None:
+                    table[key] = split_comment(value)
+
+        for (section, option), fn in chain(rules.items(), dependent_rules.items()):
+            try:
+                container = doc[section]
+                value = container[option]
+            except KeyError:
+                continue
             if value is not None:
-                doc[section][option] = fn(value)
+                container[option] = fn(value)
         return doc
 
     def merge_and_rename_urls(self, doc: R) -> R:
@@ -244,9 +211,7 @@ class SetuptoolsPEP621:
         """
         metadata: IR = doc["metadata"]
         new_urls = [
-            (dest, metadata.pop(orig))
-            for orig, dest in [("url", "Homepage"), ("download-url", "Download")]
-            if orig in metadata
+            (dest, metadata.pop(orig)) for orig, dest in URL_RENAMES if orig in metadata
         ]
         urls = metadata.get("project-urls", CommentedKV())
         for k, v in reversed(new_urls):
@@ -267,24 +232,26 @@ class SetuptoolsPEP621:
         """
         metadata: IR = doc["metadata"]
 
-        def _split_values(field: str) -> Tuple[Iterator[str], Optional[str]]:
+        def _split_values(field: str) -> Tuple[List[str], Optional[str]]:
             commented: Commented[str] = metadata.get(field, Commented())
             values = commented.value_or("").strip().split(",")
-            return (v.strip() for v in values), commented.comment
+            return [v.strip() for v in values], commented.comment
 
         for key in ("author", "maintainer"):
             fields = (key, f"{key}-email")
-            values, comments = zip(*(_split_values(f) for f in fields))
+            names, name_comment = _split_values(key)
+            emails, email_comment = _split_values(fields[1])
             combined = (
-                {k: v for k, v in zip(("name", "email"), person_data) if v}
+                {k: v for k, v in (("name", name), ("email", email)) if v}
                 # ^-- Remove empty fields
-                for person_data in zip_longest(*values, fillvalue="")
+                for name, email in zip_longest(names, emails, fillvalue="")
             )
             people = [IR(c) for c in combined if c]  # type: ignore[arg-type]
 
             if people:
                 # author/maintainer => author**S**/maintainer**S**
                 i = metadata.replace_first_remove_others(fields, f"{key}s", people)
+                comments = (name_comment, email_comment)
                 for j, cmt in enumerate(c for c in comments if c):
                     metadata.insert(j + i + 1, CommentKey(), cmt)
         return doc
@@ -332,7 +299,7 @@ class SetuptoolsPEP621:
             metadata.pop("long-description")
             return doc
 
-        if len(list(readme.keys())) == 1 and "file" in readme:
+        if len(readme) == 1 and "file" in readme:
             metadata["long-description"] = readme["file"]
         else:
             metadata["long-description"] = IR(readme)  # type: ignore[arg-type]
@@ -364,15 +331,13 @@ class SetuptoolsPEP621:
             entry-points.gui-scripts => gui-scripts
             entry-points.* => "entry-points".*
         """
-        entrypoints: IR = doc.get("options.entry-points", IR())
+        entrypoints: Optional[IR] = doc.get("options.entry-points")
         if not entrypoints:
             doc.pop("options.entry-points", None)
             return doc
         doc.rename("options.entry-points", "project:entry-points")
         # ^ use `:` to guarantee it is split later
-        script_keys = ["console-scripts", "gui-scripts"]
-        script_keys += [k.replace("-", "_") for k in script_keys]
-        keys = (k for k in script_keys if k in entrypoints)
+        keys = [k for k in SCRIPT_ENTRYPOINTS if k in entrypoints]
         for key in keys:
             scripts: CommentedKV = entrypoints.pop(key)
             new_key = key.replace("_", "-").replace("console-", "")
@@ -386,19 +351,18 @@ class SetuptoolsPEP621:
         in ``setup.cfg "options"`` section.
         """
         # First we handle simple options
-        naming = {
-            "python-requires": "requires-python",
-            "install-requires": "dependencies",
-            "entry-points": "entry-points",
-        }
         metadata = doc.setdefault("metadata", IR())
         options = doc.setdefault("options", IR())
-        metadata.update({v: options.pop(k) for k, v in naming.items() if k in options})
+        metadata.update(
+            {v: options.pop(k) for k, v in OPTIONS_IN_PEP621 if k in options}
+        )
 
         # Then we handle entire sections:
-        naming = {"extras-require": "optional-dependencies"}
-        for src, target in naming.items():
-            doc.rename(f"options.{src}", f"project:{target}", ignore_missing=True)
+        doc.rename(
+            "options.extras-require",
+            "project:optional-dependencies",
+            ignore_missing=True,
+        )
 
         return doc
 
@@ -408,9 +372,8 @@ class SetuptoolsPEP621:
         """
         # TODO: PEP 621 does not specify an equivalent for 'License-file' metadata,
         #       but once PEP 639 is approved this will change
-        metadata = doc.get("metadata", IR())
-        non_standard = ("platforms", "provides", "obsoletes", "license-files")
-        specific = [k for k in non_standard if k in metadata]
+        metadata = doc.get("metadata", ())
+        specific = [k for k in METADATA_NOT_IN_PEP621 if k in metadata]
         if specific:
             options = doc.setdefault("options", IR())
             options.update({k: metadata.pop(k) for k in specific})
@@ -442,16 +405,17 @@ class SetuptoolsPEP621:
                 doc.pop("options.packages.find", None)
             return doc
 
-        prefix = packages.kind.replace("_", "-")
         # Enhancement #1: Unify find and find_namespaces, using `namespaces` as a flag
-        options["packages"] = Directive("find", {"namespaces": "namespace" in prefix})
-        if "options.packages.find" in doc:
+        namespaces = "namespace" in packages.kind  # find_namespace or find-namespace
+        options["packages"] = Directive("find", {"namespaces": namespaces})
+        find = doc.get("options.packages.find")
+        if find is not None:
             packages = options.pop("packages")
-            doc["options.packages.find"].update(packages["find"])
+            find.update(packages["find"])
             # Enhancement #2: ``where`` accepts multiple values (array)
-            where = doc["options.packages.find"].get("where", None)
+            where = find.get("where", None)
             if where:
-                doc["options.packages.find"]["where"] = _ensure_where_list(where)
+                find["where"] = _ensure_where_list(where)
         return doc
 
     def handle_dynamic(self, doc: R) -> R:
@@ -503,7 +467,9 @@ class SetuptoolsPEP621:
                     "when using `pyproject.toml`."
                 )
 
-        metadata.setdefault("dynamic", []).extend(fields + extras)
+        dynamic_fields = metadata.setdefault("dynamic", [])
+        dynamic_fields.extend(fields)
+        dynamic_fields.extend(extras)
         if dynamic:
             doc.setdefault("options.dynamic", IR()).update(dynamic)
             # ^ later `options.dynamic` is converted to `tool.setuptools.dynamic`
@@ -517,7 +483,7 @@ class SetuptoolsPEP621:
             return doc
 
         extras = doc["project:optional-dependencies"]
-        keys = list(extras.keys())  # Eager, so we can modify extras
+        keys = tuple(extras)  # Eager, so we can modify extras
         for key in keys:
             if not isinstance(key, str):
                 continue
@@ -543,14 +509,13 @@ class SetuptoolsPEP621:
             warnings.warn(msg, DeprecationWarning)  # noqa: B028
             requirements: CommentedList[str] = options.pop("setup-requires")
             # Deduplicate
-            existing = {Requirement(r).name: r for r in requirements.as_list()}
+            existing = {_req_name(r): r for r in requirements.as_list()}
             mandatory = {
-                Requirement(r).name: r
+                _req_name(r): r
                 for r in chain(build_system.get("requires", []), self.BUILD_REQUIRES)
             }
             new = [r for name, r in mandatory.items() if name not in existing]
-            for req in reversed(new):
-                requirements.insert_line(0, (req,))
+            requirements[:0] = [Commented([req]) for req in new]  # single insertion
             build_system["requires"] = requirements
 
         return doc
@@ -562,26 +527,26 @@ class SetuptoolsPEP621:
         It assumes ``move_options_missing_in_pep621`` already run (to populate
         ``project:optional-dependencies``.
         """
-        if "tests-require" in doc["options"]:
+        options = doc["options"]
+        if "tests-require" in options:
             msg = "The field 'tests_require' is deprecated and no longer supported. "
             msg += "Dependencies will be converted to optional (`testing` extra). "
             msg += "You can use a tool like `tox` or `nox` to replace this workflow."
             warnings.warn(msg, DeprecationWarning)  # noqa: B028
-            reqs: CommentedList[str] = doc["options"].pop("tests-require")
-            if "project:optional-dependencies" not in doc:
+            reqs: CommentedList[str] = options.pop("tests-require")
+            opt_deps = doc.get("project:optional-dependencies")
+            if opt_deps is None:
                 doc["project:optional-dependencies"] = IR(testing=reqs)
                 return doc
 
-            opt_deps = doc["project:optional-dependencies"]
             if "testing" not in opt_deps:
                 opt_deps["testing"] = reqs
 
             testing: CommentedList[str] = opt_deps["testing"]
-            test_deps = {Requirement(r).name: r for r in reqs.as_list()}
-            existing_deps = {Requirement(r).name: r for r in testing.as_list()}
+            test_deps = {_req_name(r): r for r in reqs.as_list()}
+            existing_deps = {_req_name(r): r for r in testing.as_list()}
             new = [r for name, r in test_deps.items() if name not in existing_deps]
-            for req in new:
-                testing.insert_line(len(testing), (req,))
+            testing.extend(Commented([req]) for req in new)
 
         return doc
 
@@ -599,7 +564,7 @@ class SetuptoolsPEP621:
         This function moves these arguments to their own ``distutils``
         tool-specific sub-table
         """
-        sections = list(doc.keys())
+        sections = tuple(doc)
         commands = _distutils_commands() - SKIP_COMMAND_SECTIONS
         for k in sections:
             if isinstance(k, str) and k in commands:
@@ -615,16 +580,14 @@ class SetuptoolsPEP621:
         """``setuptools`` emulate nested sections (e.g.: ``options.extras_require``)
         which can be directly expressed in TOML via sub-tables.
         """
-        sections = [
-            k
-            for k in out.keys()
-            if isinstance(k, str) and (k.startswith("options.") or ":" in k)
-        ]
-        for section in sections:
-            new_key = SECTION_SPLITTER.split(section)
+        for section in tuple(out):  # eager: sections are renamed in the loop
+            if not isinstance(section, str):
+                continue
             if section.startswith("options."):
-                new_key = ["tool", "setuptools", *new_key[1:]]
-            out.rename(section, tuple(new_key))
+                _, *rest = SECTION_SPLITTER.split(section)
+                out.rename(section, ("tool", "setuptools", *rest))
+            elif ":" in section:
+                out.rename(section, tuple(SECTION_SPLITTER.split(section)))
         return out
 
     def ensure_pep518(self, doc: R) -> R:
@@ -632,17 +595,14 @@ class SetuptoolsPEP621:
         ``pyproject.toml`` should use the ``tool`` table. This means that the only
         top-level keys are ``build-system``, ``project`` and ``tool``.
         """
-        allowed = ("build-system", "project", "tool", "metadata", "options")
-        allowed_prefixes = ("options.", "project:")
-        for k in list(doc.keys()):
-            key = k
-            rest: Sequence = ()
-            if isinstance(k, tuple) and not isinstance(key, HiddenKey):
-                key, *rest = k
+        for k in tuple(doc):
+            nested = isinstance(k, tuple)
+            key = k[0] if nested else k
             if isinstance(key, HiddenKey):
                 continue
-            if not (key in allowed or any(key.startswith(p) for p in allowed_prefixes)):
-                doc.rename(k, ("tool", key, *rest))
+            if not (key in PEP518_ALLOWED or key.startswith(PEP518_ALLOWED_PREFIXES)):
+                # A single rename keeps the position of the section in the document
+                doc.rename(k, ("tool", *k) if nested else ("tool", k))
         return doc
 
     def pep621_transform(self, doc: R) -> R:
@@ -678,7 +638,8 @@ class SetuptoolsPEP621:
         out.update(doc)
         out.setdefault("metadata", IR())
         out.setdefault("options", IR())
-        out = reduce(apply, transformations, out)
+        for fn in transformations:
+            out = fn(out)
         out.rename("metadata", "project", ignore_missing=True)
         out.rename("options", ("tool", "setuptools"), ignore_missing=True)
         return out
@@ -692,31 +653,32 @@ class SetuptoolsPEP621:
            :pep:`518` and :pep:`621`) so this normalisation makes more sense for the
            translation.
         """
+        aliases = self.setupcfg_aliases()
         # Normalise for the same convention as pyproject
         for i in range(len(cfg.order)):
             section_name = cfg.order[i]
             if not isinstance(section_name, str):
                 continue
-            if not any(section_name.startswith(s) for s in SETUPTOOLS_SECTIONS):
+            if not section_name.startswith(SETUPTOOLS_SECTIONS):
                 continue
             section = cfg[section_name]
-            cfg.rename(section_name, kebab_case(section_name))
-            if any(section_name.startswith(s) for s in SKIP_CHILD_NORMALISATION):
+            new_section_name = kebab_case(section_name)
+            cfg.rename(section_name, new_section_name)
+            if section_name.startswith(SKIP_CHILD_NORMALISATION):
                 continue
+            # Aliases are only valid in ``metadata``, replace them in the same pass
+            is_metadata = new_section_name == "metadata"
             for j in range(len(section.order)):
                 option_name = section.order[j]
                 if not isinstance(option_name, str):
                     continue
-                section.rename(option_name, self.normalise_key(option_name))
-        # Normalise aliases
-        metadata = cfg.get("metadata")
-        if not metadata:
-            return cfg
-        for alias, cannonic in self.setupcfg_aliases().items():
-            if alias in metadata:
-                msg = f"{alias!r} is deprecated. Translating to {cannonic!r} instead."
-                warnings.warn(msg, DeprecationWarning)  # noqa: B028
-                metadata.rename(alias, cannonic)
+                key = self.normalise_key(option_name)
+                if is_metadata and key in aliases:
+                    cannonic = aliases[key]
+                    msg = f"{key!r} is deprecated. Translating to {cannonic!r} instead."
+                    warnings.warn(msg, DeprecationWarning)  # noqa: B028
+                    key = cannonic
+                section.rename(option_name, key)
         return cfg
 
     def normalise_key(self, key: str) -> str:
@@ -751,12 +713,12 @@ def directive(*directives: str, orelse=split_comment):
 def split_directive(
     value: str, directives: Sequence[str] = ("file", "attr"), orelse=split_comment
 ):
-    candidates = (d for d in directives if value.strip().startswith(f"{d}:"))
-    directive = next(candidates, None)
-    if directive is None:
+    # Directive names never contain ':', so partition finds the separator directly
+    directive, sep, raw_value = value.strip().partition(":")
+    if not sep or directive not in directives:
         return orelse(value)
 
-    raw_value = value.lstrip()[len(directive) + 1 :].strip()
+    raw_value = raw_value.strip()
     if directive == "file":
         return Directive(directive, split_list_comma(raw_value))
     return Directive(directive, split_comment(raw_value))
@@ -771,14 +733,99 @@ def value_error(field: str):
     return _fn
 
 
-def _distutils_commands() -> Set[str]:
+@lru_cache(maxsize=1)
+def _processing_rules() -> Mapping[Tuple[str, ...], Transformation]:
+    # The rules are stateless, so they can be built once and shared (read-only)
+    return MappingProxyType(
+        {
+            ("metadata", "version"): directive("file", "attr"),
+            ("metadata", "classifiers"): directive("file", orelse=split_list_comma),
+            ("metadata", "keywords"): split_keywords,
+            ("metadata", "description"): directive("file"),
+            # ---
+            ("metadata", "long-description"): directive("file", orelse=noop),
+            ("metadata", "long-description-content-type"): split_hash_comment,
+            # => NOTICE: further processed via
+            #            `merge_and_rename_long_description_and_content_type`
+            # ---
+            ("metadata", "license-files"): split_list_comma,
+            # => NOTICE: not standard for now, needs PEP 639
+            #            further processed via `remove_metadata_not_in_pep621`
+            # ---
+            ("metadata", "url"): split_url,
+            ("metadata", "download-url"): split_url,
+            ("metadata", "project-urls"): split_kv_urls,
+            # => NOTICE: further processed via `merge_and_rename_urls`
+            # ---- Not covered by PEP 621 ----
+            ("metadata", "platforms"): split_list_comma,
+            # ---
+            ("metadata", "provides"): split_list_comma,
+            ("metadata", "requires"): deprecated("requires", split_list_comma),
+            ("metadata", "obsoletes"): split_list_comma,
+            # => NOTICE: not supported by pip
+            # ---- Options ----
+            ("options", "zip-safe"): split_bool,
+            ("options", "setup-requires"): split_deps,
+            ("options", "install-requires"): directive("file", orelse=split_deps),
+            ("options", "tests-require"): split_deps,
+            ("options", "scripts"): split_list_comma,
+            ("options", "eager-resources"): split_list_comma,
+            ("options", "dependency-links"): deprecated(
+                "dependency-links", split_list_comma
+            ),  # noqa
+            ("options", "entry-points"): directive(
+                "file", orelse=value_error("option.entry-points")
+            ),
+            ("options", "include-package-data"): split_bool,
+            ("options", "package-dir"): split_kv_pairs,
+            ("options", "namespace-packages"): split_list_comma,
+            ("options", "py-modules"): split_list_comma,
+            ("options", "cmdclass"): split_kv_pairs,
+            ("options", "data-files"): deprecated("data-files", split_kv_of_lists),
+            ("options", "packages"): directive(
+                "find", "find_namespace", orelse=split_list_comma
+            ),
+            ("options.packages.find", "include"): split_list_comma,
+            ("options.packages.find", "exclude"): split_list_comma,
+            ("options.packages.find", "exclude"): split_list_comma,
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def _dependent_processing_groups() -> Mapping[str, Transformation]:
+    # Stateless, shared (read-only) between calls, see _processing_rules
+    return MappingProxyType(
+        {
+            "options.extras-require": directive("file", orelse=split_deps),
+            "options.package-data": split_list_comma,
+            "options.exclude-package-data": split_list_comma,
+            "options.data-files": split_list_comma,
+            "options.entry-points": split_kv_pairs,
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def _distutils_commands() -> FrozenSet[str]:
+    # Importing distutils is expensive (in recent versions of Python it is provided by
+    # setuptools), so it is postponed until the command sections are needed.
+    # The result does not change during the execution, so it is computed only once.
+    from distutils import command as distutils_commands
+
     try:
         from . import iterate_entry_points
 
         commands = [ep.name for ep in iterate_entry_points("distutils.commands")]
     except Exception:
         commands = []
-    return {*commands, *COMMAND_SECTIONS}
+    builtin = getattr(distutils_commands, "__all__", [])
+    return frozenset((*commands, *builtin, *COMMAND_SECTIONS))
+
+
+@lru_cache(maxsize=1024)
+def _req_name(requirement: str) -> str:
+    return Requirement(requirement).name
 
 
 def _ensure_where_list(where):
@@ -14,7 +14,7 @@ While it can be used by plugin writers, it is not intended for general public us
 
 import warnings
 from collections.abc import MutableMapping
-from functools import reduce, wraps
+from functools import lru_cache, partial, reduce, wraps
 from typing import (
     Any,
     Callable,
@@ -77,16 +77,18 @@ def noop(x: T) -> T:
     return x
 
 
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+_FALSE_VALUES = frozenset(("false", "0", "no", "off", "none", "null", "nil"))
+
+
 def is_true(value: str) -> bool:
     """``value in ("true", "1", "yes", "on")``"""
-    value = value.lower()
-    return value in ("true", "1", "yes", "on")
+    return value.lower() in _TRUE_VALUES
 
 
 def is_false(value: str) -> bool:
     """``value in ("false", "0", "no", "off", "none", "null", "nil")``"""
-    value = value.lower()
-    return value in ("false", "0", "no", "off", "none", "null", "nil")
+    return value.lower() in _FALSE_VALUES
 
 
 def is_float(value: str) -> bool:
@@ -94,13 +96,26 @@ def is_float(value: str) -> bool:
     return cleaned.isdecimal() and value.count(".") <= 1 or cleaned in ("inf", "nan")
 
 
+_BOOLEAN_LITERALS = {
+    **dict.fromkeys(_TRUE_VALUES, True),
+    **dict.fromkeys(_FALSE_VALUES, False),
+}
+# Common spellings (e.g. ``True``, ``FALSE``) can be resolved without ``lower()``
+_BOOLEAN_SPELLINGS = {
+    **_BOOLEAN_LITERALS,
+    **{k.title(): v for k, v in _BOOLEAN_LITERALS.items()},
+    **{k.upper(): v for k, v in _BOOLEAN_LITERALS.items()},
+}
+
+
 def coerce_bool(value: str) -> bool:
     """Convert the value based on :func:`~.is_true` and :func:`~.is_false`."""
-    if is_true(value):
-        return True
-    if is_false(value):
-        return False
-    raise ValueError(f"{value!r} cannot be converted to boolean")
+    flag = _BOOLEAN_SPELLINGS.get(value)
+    if flag is None:
+        flag = _BOOLEAN_LITERALS.get(value.lower())  # both checks in a single lookup
+        if flag is None:
+            raise ValueError(f"{value!r} cannot be converted to boolean")
+    return flag
 
 
 def coerce_scalar(value: str) -> Scalar:
@@ -120,16 +135,13 @@ def coerce_scalar(value: str) -> Scalar:
         return int(value)
     if is_float(value):
         return float(value)
-    if is_true(value):
-        return True
-    elif is_false(value):
-        return False
     # Do we need this? Or is there a better way? How about time objects
     # > try:
     # >     return datetime.fromisoformat(value)
     # > except ValueError:
     # >     pass
-    return value
+    # Equivalent to trying ``is_true``/``is_false`` in sequence, but in a single step
+    return _BOOLEAN_LITERALS.get(value.lower(), value)
 
 
 def kebab_case(field: str) -> str:
@@ -171,18 +183,30 @@ def split_comment(value, coerce_fn=noop, comment_prefixes=CP):
     if not isinstance(value, str):
         return value
     value = value.strip()
-    prefixes = [p for p in comment_prefixes if p in value]
-
     # We just process inline comments for single line options
-    if not prefixes or len(value.splitlines()) > 1:
+    if len(value.splitlines()) > 1:
         return Commented(coerce_fn(value))
+    return _split_line_comment(value, coerce_fn, tuple(comment_prefixes))
+
+
+def _split_line_comment(
+    line: str, coerce_fn, comment_prefixes: Tuple[str, ...]
+) -> Commented:
+    """Same as :func:`split_comment` for a ``line`` known not to contain line breaks
+    (e.g. an item produced by :meth:`str.splitlines`).
+    """
+    line = line.strip()
+    for prefix in comment_prefixes:
+        if prefix in line:
+            break  # We can only analyse one...
+    else:
+        return Commented(coerce_fn(line))
 
-    if any(value.startswith(p) for p in comment_prefixes):
-        return Commented(comment=_strip_prefix(value, comment_prefixes))
+    if line.startswith(comment_prefixes):
+        return Commented(comment=_strip_prefix(line, comment_prefixes))
 
-    prefix = prefixes[0]  # We can only analyse one...
-    value, _, cmt = value.partition(prefix)
-    return Commented(coerce_fn(value.strip()), _strip_prefix(cmt, comment_prefixes))
+    line, _, cmt = line.partition(prefix)
+    return Commented(coerce_fn(line.strip()), _strip_prefix(cmt, comment_prefixes))
 
 
 def split_scalar(value: str, *, comment_prefixes=CP) -> Commented[Scalar]:
@@ -241,16 +265,19 @@ def split_list(
     """
     if not isinstance(value, str):
         return value
-    comment_prefixes = [p for p in comment_prefixes if sep not in p]
+    comment_prefixes = _filter_prefixes(tuple(comment_prefixes), sep)
 
     values = value.strip().splitlines()
     if not subsplit_dangling and (len(values) > 1 or force_multiline):
         sep += "\n"  # force a pattern that cannot be found in a split line
 
-    def _split(line: str) -> list:
-        return [coerce_fn(v.strip()) for v in line.split(sep) if v]
-
-    return CommentedList([split_comment(v, _split, comment_prefixes) for v in values])
+    _split = partial(_split_items, sep, coerce_fn)
+    if not any(p in value for p in comment_prefixes):
+        # Common case: no comments to be extracted from the lines
+        return CommentedList([Commented(_split(v.strip())) for v in values])
+    return CommentedList(
+        [_split_line_comment(v, _split, comment_prefixes) for v in values]
+    )
 
 
 @overload
@@ -303,21 +330,38 @@ def split_kv_pairs(
     For each item in this list, the key is separated from the value by ``key_sep``.
     ``coerce_fn`` is used to convert the value in each pair.
     """
-    prefixes = [p for p in comment_prefixes if key_sep not in p and pair_sep not in p]
+    prefixes = _filter_prefixes(tuple(comment_prefixes), key_sep, pair_sep)
 
     values = value.strip().splitlines()
     if not subsplit_dangling and len(values) > 1:
         pair_sep += "\n"  # force a pattern that cannot be found in a split line
 
-    def _split_kv(line: str) -> List[KV]:
-        pairs = (
-            item.split(key_sep, maxsplit=1)
-            for item in line.strip().split(pair_sep)
-            if key_sep in item
-        )
-        return [(k.strip(), coerce_fn(v.strip())) for k, v in pairs]
+    _split_kv = partial(_split_kv_items, key_sep, pair_sep, coerce_fn)
+    if not any(p in value for p in prefixes):
+        # Common case: no comments to be extracted from the lines
+        return CommentedKV([Commented(_split_kv(v.strip())) for v in values])
+    return CommentedKV([_split_line_comment(v, _split_kv, prefixes) for v in values])
+
+
+@lru_cache(maxsize=64)
+def _filter_prefixes(comment_prefixes: Tuple[str, ...], *seps: str) -> Tuple[str, ...]:
+    """Remove the comment prefixes that would clash with any of the separators"""
+    return tuple(p for p in comment_prefixes if not any(s in p for s in seps))
+
+
+def _split_items(sep: str, coerce_fn: CoerceFn, line: str) -> list:
+    return [coerce_fn(v.strip()) for v in line.split(sep) if v]
+
 
-    return CommentedKV([split_comment(v, _split_kv, prefixes) for v in values])
+def _split_kv_items(
+    key_sep: str, pair_sep: str, coerce_fn: CoerceFn, line: str
+) -> List[KV]:
+    pairs = (
+        item.partition(key_sep)
+        for item in line.strip().split(pair_sep)
+        if key_sep in item
+    )
+    return [(k.strip(), coerce_fn(v.strip())) for k, _, v in pairs]
 
 
 # ---- Public Helpers ----
@@ -31,6 +31,18 @@ def convert(translator):
     return lambda irepr: translator.dumps(irepr)
 
 
+def test_processing_rules_can_be_modified(plugin):
+    rules = plugin.processing_rules()
+    rules[("metadata", "name")] = str.upper
+    assert plugin.processing_rules().get(("metadata", "name")) is not str.upper
+
+
+def test_setupcfg_aliases_can_be_modified(plugin):
+    aliases = plugin.setupcfg_aliases()
+    aliases["classifier"] = "keywords"
+    assert plugin.setupcfg_aliases()["classifier"] == "classifiers"
+
+
 example_normalise_keys = """\
 [metadata]
 summary = Automatically translates .cfg/.ini files into TOML
@@ -1,3 +1,4 @@
+import io
 import logging
 import sys
 from unittest.mock import MagicMock
@@ -120,3 +121,40 @@ def test_help(capsys):
     expected = " ".join(x.strip() for x in expected_profile_desc.splitlines())
     print(out)
     assert expected in text
+
+
+def test_build_parser_is_cached():
+    profiles = [_profile(n) for n in "setup.cfg default.cfg".split()]
+    aug = [_aug(n, True) for n in "hello world".split()]
+    parser = cli.build_parser(profiles, aug)
+    assert cli.build_parser(list(profiles), list(aug)) is parser
+    # Different profiles/augmentations should result in different parsers
+    assert cli.build_parser(profiles[:1], aug) is not parser
+    assert cli.build_parser(profiles, [_aug("hello", False)]) is not parser
+
+
+def test_run_from_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("[section]\nkey = 42\n"))
+    cli.run(["-", "-p", "best_effort"])
+    out, _ = capsys.readouterr()
+    assert "[section]" in out
+    assert "key = 42" in out
+
+
+def test_run_missing_input_keeps_output(tmp_path, capsys):
+    output = tmp_path / "pyproject.toml"
+    output.write_text("[tool.x]\n", encoding="utf-8")
+    missing = tmp_path / "typo.cfg"
+    with pytest.raises(SystemExit) as exc:
+        cli.run([str(missing), "-o", str(output)])
+    assert exc.value.code == 2
+    assert "can't open" in capsys.readouterr().err
+    assert output.read_text(encoding="utf-8") == "[tool.x]\n"
+
+
+def test_run_to_output_file(tmp_path):
+    input_file = tmp_path / "file.ini"
+    input_file.write_text("[section]\nkey = 42\n", encoding="utf-8")
+    output = tmp_path / "out.toml"
+    cli.run([str(input_file), "-p", "best_effort", "-o", str(output)])
+    assert "key = 42" in output.read_text(encoding="utf-8")
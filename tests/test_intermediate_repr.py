@@ -43,6 +43,13 @@ class TestInteremediateRepr:
         assert other["a"] == 3
         assert irepr["a"] == 1
 
+    def test_replace_first_remove_others(self):
+        irepr = IR({"a": 1, "b": 2, "c": 3, "d": 4})
+        assert irepr.replace_first_remove_others(["d", "b", "x"], "e", 5) == 1
+        assert irepr == IR({"a": 1, "e": 5, "c": 3})
+        assert irepr.replace_first_remove_others(["x", "y"], "f", 6) == 3
+        assert irepr == IR({"a": 1, "e": 5, "c": 3, "f": 6})
+
 
 class TestCommentedKV:
     def test_find(self):
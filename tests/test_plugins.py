@@ -3,6 +3,8 @@
 # The original PyScaffold license can be found in 'tests/examples/pyscaffold'
 
 
+from importlib import metadata
+
 import pytest
 
 from ini2toml import plugins
@@ -57,3 +59,22 @@ def test_list_from_entry_points():
     plugin_names = " ".join(str(e.__module__) for e in pluging_list)
     assert len(pluging_list) == orig_len - isort_count
     assert "isort" not in plugin_names
+
+
+def test_iterate_entry_points__cached(monkeypatch):
+    plugins._all_entry_points.cache_clear()
+    calls = []
+    orig = metadata.entry_points
+
+    def _entry_points():
+        calls.append(1)
+        return orig()
+
+    monkeypatch.setattr(metadata, "entry_points", _entry_points)
+    try:
+        first = [e.name for e in plugins.iterate_entry_points()]
+        second = [e.name for e in plugins.iterate_entry_points()]
+    finally:
+        plugins._all_entry_points.cache_clear()
+    assert first == second
+    assert len(calls) == 1
@@ -21,6 +21,15 @@ def test_coerce_bool():
         lib.coerce_bool("3")
 
 
+def test_coerce_scalar():
+    assert lib.coerce_scalar(" 42 ") == 42
+    assert lib.coerce_scalar("1") == 1
+    assert lib.coerce_scalar("-4.2") == -4.2
+    assert lib.coerce_scalar("Yes") is True
+    assert lib.coerce_scalar("NONE") is False
+    assert lib.coerce_scalar("hello") == "hello"
+
+
 def test_split_comment():
     example = "1 # comment"
     assert lib.split_comment(example) == lib.Commented("1", "comment")